@@ -1,28 +1,104 @@
-"""Todo List Application - CLI Entry Point."""
-import argparse
+"""Todo List Application - CLI Entry Point.
+
+Only stdlib modules are imported at module level so that ``--help`` and
+``--version`` never pay for importing pydantic or building domain schemas.
+Domain imports happen inside ``_dispatch``, the single place where a
+subcommand is actually executed. Trivial invocations (no arguments or a
+bare ``--version``) are answered before ``argparse`` is even imported.
+"""
+from __future__ import annotations
+
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+
+PROG = "todo_list"
+VERSION = "0.1.0"
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the arguments of the ``add`` subcommand."""
+    parser.add_argument("name", help="Task name")
+    parser.add_argument("--description", default=None, help="Task description")
+
+
+# name -> (help text, argument thunk). Thunks only run for the invoked command.
+_SUBCOMMANDS = {
+    "add": ("Create a new task", _add_arguments),
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the first non-flag token of ``argv[1:]``, if any."""
+    for token in argv[1:]:
+        if not token.startswith("-"):
+            return token
+    return None
+
 
+def create_parser(subcommand: str | None = None) -> argparse.ArgumentParser:
+    """
+    Create and configure the argument parser.
+
+    Every subcommand is registered so it shows up in ``--help``, but only
+    the one named by ``subcommand`` gets its arguments built.
+    """
+    import argparse
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
-        prog="todo_list",
+        prog=PROG,
         description="Todo List Application - Task Management System",
     )
     parser.add_argument(
+        "-V",
         "--version",
         action="version",
-        version="%(prog)s 0.1.0",
+        version=f"%(prog)s {VERSION}",
     )
+    subparsers = parser.add_subparsers(dest="command")
+
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == subcommand:
+            add_arguments(subparser)
+
     return parser
 
 
+def _dispatch(args: argparse.Namespace) -> int:
+    """Execute the selected subcommand, importing domain code on demand."""
+    if args.command == "add":
+        from pydantic import ValidationError
+
+        from src.tasks.domain.entities import Task
+
+        try:
+            task = Task(name=args.name, description=args.description)
+        except ValidationError as exc:
+            for error in exc.errors():
+                field = ".".join(str(part) for part in error["loc"])
+                print(f"{PROG} add: error: {field}: {error['msg']}", file=sys.stderr)
+            return 2
+        print(task)
+    # argparse rejects unknown commands; a missing command is a no-op.
+    return 0
+
+
 def main() -> int:
     """Main entry point for the application."""
-    parser = create_parser()
-    parser.parse_args()
-    return 0
+    argv = sys.argv[1:]
+    if not argv:
+        return 0
+    if argv == ["--version"] or argv == ["-V"]:
+        print(f"{PROG} {VERSION}")
+        return 0
+
+    parser = create_parser(_sniff_subcommand(sys.argv))
+    args = parser.parse_args()
+    return _dispatch(args)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    raise SystemExit(main())
@@ -0,0 +1,24 @@
+"""
+Shared kernel - lazily re-exports domain building blocks.
+
+Re-exports are resolved on first access through a PEP 562 module
+``__getattr__``, so importing a package (e.g. from the CLI) does not
+import pydantic until a domain class is actually used. src.tasks follows
+the same pattern.
+"""
+
+__all__ = [
+    "ACTIVE_STATE",
+    "DELETED_STATE",
+    "INACTIVE_STATE",
+    "Entity",
+    "EntityState",
+]
+
+
+def __getattr__(name: str) -> object:
+    if name in __all__:
+        from src.shared.domain import base_entity
+
+        return getattr(base_entity, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
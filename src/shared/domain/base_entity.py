@@ -9,27 +9,28 @@ Responsibility:
 - Support audit trail and versioning patterns
 
 Key Components:
-- EntityState: State enumeration (inactive, active, deleted)
+- EntityState: State constants (inactive, active, deleted)
+- INACTIVE_STATE / ACTIVE_STATE / DELETED_STATE: plain int state values
 - Entity: Base class with identity, audit, and lifecycle management
 
 Invariants:
 - All entities have unique id (UUID)
 - All entities track creation and modification metadata
 - State transitions follow 0 (inactive) -> 1 (active) -> 2 (deleted)
+- state is always stored as a plain int; hot filters can compare it
+  directly, e.g. [e for e in entities if e.state == ACTIVE_STATE]
 
 Related Docs:
 - docs/shared/domain/base-entity.md
 """
 
 from datetime import UTC, datetime
-from enum import IntEnum
-from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
-class EntityState(IntEnum):
+class EntityState:
     """
     IDK: state-machine, entity-lifecycle, soft-delete
 
@@ -39,7 +40,7 @@ class EntityState(IntEnum):
 
     Invariants:
     - Only three states allowed: INACTIVE (0), ACTIVE (1), DELETED (2)
-    - State values are immutable integers
+    - State values are plain int constants
 
     State:
     - 0: INACTIVE - Entity is deactivated but can be reactivated
@@ -49,11 +50,19 @@ class EntityState(IntEnum):
     Related Docs:
     - docs/shared/domain/entity-state.md
     """
+    __slots__ = ()
+
     INACTIVE = 0
     ACTIVE = 1
     DELETED = 2
 
 
+# Module-level aliases: a global lookup instead of a class attribute lookup.
+INACTIVE_STATE: int = EntityState.INACTIVE
+ACTIVE_STATE: int = EntityState.ACTIVE
+DELETED_STATE: int = EntityState.DELETED
+
+
 class Entity(BaseModel):
     """
     IDK: domain-entity, aggregate-root, audit-trail
@@ -67,12 +76,15 @@ class Entity(BaseModel):
     - id is unique and immutable (UUID v4)
     - code is required and serves as business identifier
     - created_at/updated_at always set to UTC
+    - updated_at defaults to created_at
     - state must be 0, 1, or 2 (INACTIVE, ACTIVE, DELETED)
     - version increments on each update
+    - fields are validated at construction only; assignments are not
+      re-validated, so mutate through the lifecycle methods
 
     Collaborators:
     - Pydantic BaseModel: validation and serialization
-    - EntityState: state enumeration
+    - EntityState: state constants
 
     Failure Modes:
     - ValidationError: invalid field values
@@ -84,34 +96,27 @@ class Entity(BaseModel):
 
     model_config = ConfigDict(
         extra='forbid',
-        validate_assignment=True,
-        use_enum_values=True,
-        json_schema_extra={
-            "description": "Base entity with audit and metadata fields"
-        }
+        validate_assignment=False,
     )
 
     # Core Identity Fields
     id: str = Field(
         default_factory=lambda: str(uuid4()),
-        description="Unique identifier (UUID v4)",
-        examples=["550e8400-e29b-41d4-a716-446655440000"]
+        description="Unique identifier (UUID v4)"
     )
 
     code: str = Field(
         ...,
         min_length=1,
         max_length=100,
-        description="Business code/reference (e.g., SKU, employee ID)",
-        examples=["PROD-001", "EMP-2024-001"]
+        description="Business code/reference (e.g., SKU, employee ID)"
     )
 
     name: str = Field(
         ...,
         min_length=1,
         max_length=255,
-        description="Human-readable name",
-        examples=["Product Name", "John Doe"]
+        description="Human-readable name"
     )
 
     # Business Metadata
@@ -124,8 +129,7 @@ class Entity(BaseModel):
     type: str | None = Field(
         default=None,
         max_length=50,
-        description="Entity type discriminator",
-        examples=["product", "user", "supplier"]
+        description="Entity type discriminator"
     )
 
     # Audit Trail - Creation
@@ -154,18 +158,16 @@ class Entity(BaseModel):
 
     # State Management
     state: int = Field(
-        default=EntityState.ACTIVE,
+        default=ACTIVE_STATE,
         ge=0,
         le=2,
-        description="Entity state: 0=inactive, 1=active, 2=deleted",
-        examples=[0, 1, 2]
+        description="Entity state: 0=inactive, 1=active, 2=deleted"
     )
 
     status: str | None = Field(
         default=None,
         max_length=50,
-        description="Business status (domain-specific)",
-        examples=["pending", "approved", "completed", "draft"]
+        description="Business status (domain-specific)"
     )
 
     version: int = Field(
@@ -193,30 +195,27 @@ class Entity(BaseModel):
         description="Owner user ID (for access control)"
     )
 
-    @field_validator('updated_at', mode='before')
-    @classmethod
-    def sync_updated_at(cls, v: Any, info) -> datetime:
+    @model_validator(mode='after')
+    def default_updated_at(self) -> "Entity":
         """
         IDK: audit-trail, timestamp-sync, validation
 
         Responsibility:
-        - Ensure updated_at reflects current time on modification
+        - Align a defaulted updated_at with created_at on new entities
 
         Invariants:
-        - Always returns UTC datetime
-        - Overrides any manually provided value
-
-        Inputs:
-        - v (Any): provided value (ignored)
-        - info: validator context
+        - Explicitly provided updated_at is kept
+        - model_fields_set is left untouched
 
         Outputs:
-        - datetime: current UTC timestamp
+        - Entity: self
 
         Related Docs:
         - docs/shared/domain/audit-trail.md
         """
-        return datetime.now(UTC)
+        if "updated_at" not in self.model_fields_set:
+            self.__dict__["updated_at"] = self.created_at
+        return self
 
     def mark_updated(self, user_id: str | None = None) -> None:
         """
@@ -266,7 +265,7 @@ class Entity(BaseModel):
         Related Docs:
         - docs/shared/domain/entity-lifecycle.md
         """
-        self.state = EntityState.INACTIVE
+        self.state = INACTIVE_STATE
         self.mark_updated(user_id)
 
     def activate(self, user_id: str | None = None) -> None:
@@ -290,7 +289,7 @@ class Entity(BaseModel):
         Related Docs:
         - docs/shared/domain/entity-lifecycle.md
         """
-        self.state = EntityState.ACTIVE
+        self.state = ACTIVE_STATE
         self.mark_updated(user_id)
 
     def delete(self, user_id: str | None = None) -> None:
@@ -316,7 +315,7 @@ class Entity(BaseModel):
         Related Docs:
         - docs/shared/domain/soft-delete.md
         """
-        self.state = EntityState.DELETED
+        self.state = DELETED_STATE
         self.mark_updated(user_id)
 
     def is_active(self) -> bool:
@@ -338,7 +337,7 @@ class Entity(BaseModel):
         Related Docs:
         - docs/shared/domain/entity-lifecycle.md
         """
-        return self.state == EntityState.ACTIVE
+        return self.state == ACTIVE_STATE
 
     def is_deleted(self) -> bool:
         """
@@ -359,7 +358,7 @@ class Entity(BaseModel):
         Related Docs:
         - docs/shared/domain/soft-delete.md
         """
-        return self.state == EntityState.DELETED
+        return self.state == DELETED_STATE
 
     def is_inactive(self) -> bool:
         """
@@ -380,7 +379,7 @@ class Entity(BaseModel):
         Related Docs:
         - docs/shared/domain/entity-lifecycle.md
         """
-        return self.state == EntityState.INACTIVE
+        return self.state == INACTIVE_STATE
 
     def __str__(self) -> str:
         return (
@@ -0,0 +1,15 @@
+"""
+Tasks bounded context - lazily re-exports the Task entity.
+
+See src.shared for why re-exports are resolved lazily.
+"""
+
+__all__ = ["Task"]
+
+
+def __getattr__(name: str) -> object:
+    if name in __all__:
+        from src.tasks.domain import entities
+
+        return getattr(entities, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
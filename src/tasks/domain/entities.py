@@ -20,12 +20,21 @@ Related Docs:
 - docs/tasks/domain/task-entity.md
 """
 
+from functools import cache
+from typing import Any
 from uuid import uuid4
 
-from pydantic import ConfigDict, Field
+from pydantic import Field, TypeAdapter
 
 from src.shared.domain.base_entity import Entity
 
+_CODE_PREFIX = "TASK-"
+
+
+def _generate_code() -> str:
+    """Return a new TASK-{8-char-uuid-hex} business code."""
+    return _CODE_PREFIX + uuid4().hex[:8]
+
 
 class Task(Entity):
     """
@@ -37,9 +46,9 @@ class Task(Entity):
     - Enable task lifecycle management
 
     Invariants:
-    - code auto-generates as TASK-{8-char-uuid}
+    - code auto-generates as TASK-{8-char-uuid-hex}
     - status defaults to "pending"
-    - Inherits all Entity fields and methods
+    - Inherits all Entity fields, methods and model_config
 
     Collaborators:
     - Entity: base class providing identity and lifecycle
@@ -49,14 +58,8 @@ class Task(Entity):
     - docs/tasks/domain/task-entity.md
     """
 
-    model_config = ConfigDict(
-        extra='forbid',
-        validate_assignment=True,
-        use_enum_values=True,
-    )
-
     code: str = Field(
-        default_factory=lambda: f"TASK-{str(uuid4())[:8]}",
+        default_factory=_generate_code,
         min_length=1,
         max_length=100,
         description="Auto-generated task code (TASK-{uuid})",
@@ -67,3 +70,67 @@ class Task(Entity):
         max_length=50,
         description="Task status (pending, in_progress, completed, etc)",
     )
+
+    @classmethod
+    def build_many(cls, items: list[dict[str, Any]]) -> list["Task"]:
+        """
+        IDK: bulk-construction, validation, factory
+
+        Responsibility:
+        - Validate and build many tasks in a single pydantic-core call
+
+        Invariants:
+        - Same validation rules as Task(**item) for every item
+        - Output order matches input order
+
+        Inputs:
+        - items (list[dict]): raw task data
+
+        Outputs:
+        - list[Task]: validated instances of cls
+
+        Failure Modes:
+        - ValidationError: any item is invalid
+
+        Related Docs:
+        - docs/tasks/domain/task-entity.md
+        """
+        return _list_adapter(cls).validate_python(items)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "Task":
+        """
+        IDK: hydration, trusted-data, factory
+
+        Responsibility:
+        - Rebuild a task from data that was validated when it was written
+          (database rows, cache entries) without re-running validation
+
+        Invariants:
+        - No Field constraints or validators run; caller guarantees validity
+        - Missing fields still receive their defaults
+        - A missing updated_at mirrors created_at, as in validation
+
+        Inputs:
+        - data (dict): previously validated task data
+
+        Outputs:
+        - Task: task built from data as-is
+
+        Related Docs:
+        - docs/tasks/domain/task-entity.md
+        """
+        task = cls.model_construct(**data)
+        if "updated_at" not in data:
+            task.__dict__["updated_at"] = task.created_at
+        return task
+
+
+@cache
+def _list_adapter(model: type[Task]) -> TypeAdapter[list[Task]]:
+    """Return the list[model] validator, built once per Task class."""
+    return TypeAdapter(list[model])
+
+
+# Build the Task adapter at import time so the first batch pays no schema cost.
+_list_adapter(Task)
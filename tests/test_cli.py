@@ -0,0 +1,100 @@
+"""
+Tests for the CLI entry point
+
+Validates that the CLI stays cheap to start:
+- Importing the CLI module does not import pydantic
+- Package re-exports are resolved lazily
+- Subcommands still reach the domain layer
+"""
+
+import subprocess
+import sys
+
+from src.app import __main__ as cli
+
+
+def _modules_after(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", f"import sys; {code}; print(sorted(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+class TestCliImports:
+    """Test the CLI does not import domain code at startup"""
+
+    def test_cli_import_skips_pydantic(self):
+        """Importing the CLI module should not import pydantic"""
+        assert "pydantic" not in _modules_after("import src.app.__main__")
+
+    def test_package_import_skips_pydantic(self):
+        """Importing the packages should not import pydantic"""
+        assert "pydantic" not in _modules_after("import src.shared, src.tasks")
+
+    def test_lazy_reexports(self):
+        """Package-level names should resolve to the domain classes"""
+        import src.shared
+        import src.tasks
+        from src.shared.domain.base_entity import Entity
+        from src.tasks.domain.entities import Task
+
+        assert src.tasks.Task is Task
+        assert src.shared.Entity is Entity
+
+
+class TestCliFastPath:
+    """Test trivial invocations are answered without argparse"""
+
+    def test_version_skips_argparse(self):
+        """--version should not import argparse"""
+        modules = _modules_after(
+            "sys.argv = ['todo_list', '--version']; "
+            "from src.app.__main__ import main; main()"
+        )
+        assert "todo_list 0.1.0" in modules
+        assert "argparse" not in modules
+
+    def test_version_flags(self, capsys, monkeypatch):
+        """--version and -V should print the version"""
+        for flag in ("--version", "-V"):
+            monkeypatch.setattr(sys, "argv", ["todo_list", flag])
+            assert cli.main() == 0
+            assert capsys.readouterr().out == "todo_list 0.1.0\n"
+
+
+class TestCliCommands:
+    """Test CLI subcommands"""
+
+    def test_add_prints_task(self, capsys, monkeypatch):
+        """add should create a task and print it"""
+        monkeypatch.setattr(sys, "argv", ["todo_list", "add", "Buy milk"])
+        assert cli.main() == 0
+        assert "name=Buy milk" in capsys.readouterr().out
+
+    def test_add_empty_name_reports_error(self, capsys, monkeypatch):
+        """add with an empty name should report a usage error, not a traceback"""
+        monkeypatch.setattr(sys, "argv", ["todo_list", "add", ""])
+        assert cli.main() == 2
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err.startswith("todo_list add: error: name: ")
+
+
+class TestCliParser:
+    """Test lazy subcommand parser construction"""
+
+    def test_sniff_subcommand(self):
+        """The first non-flag token should be the subcommand"""
+        assert cli._sniff_subcommand(["todo_list", "-h"]) is None
+        assert cli._sniff_subcommand(["todo_list", "add", "Buy milk"]) == "add"
+
+    def test_only_sniffed_subcommand_gets_arguments(self):
+        """Unmatched subcommands should be registered without arguments"""
+        args = cli.create_parser(None).parse_args(["add"])
+        assert args.command == "add"
+        assert not hasattr(args, "name")
+
+        args = cli.create_parser("add").parse_args(["add", "Buy milk"])
+        assert args.name == "Buy milk"
@@ -9,13 +9,21 @@ Validates that Task entity properly implements domain requirements:
 - Inheritance of Entity lifecycle methods
 """
 
+from datetime import UTC, datetime
 from uuid import UUID
 
 import pytest
+from pydantic import ValidationError
 
 from src.tasks.domain.entities import Task
 
 
+@pytest.fixture
+def task() -> Task:
+    """A fresh default task for tests that do not exercise construction"""
+    return Task(name="Buy milk")
+
+
 class TestTaskInstantiation:
     """Test Task entity can be instantiated with correct defaults"""
 
@@ -42,6 +50,9 @@ class TestTaskInstantiation:
         parts = task.code.split("-")
         assert len(parts) == 2
         assert len(parts[1]) == 8
+        # Suffix comes from uuid4().hex, so it is plain lowercase hex
+        int(parts[1], 16)
+        assert parts[1] == parts[1].lower()
 
     def test_default_status_pending(self):
         """Task should default to pending status"""
@@ -67,6 +78,14 @@ class TestTaskCodeUniqueness:
 class TestTaskConfigValidation:
     """Test Task model configuration"""
 
+    def test_missing_name_reports_single_error(self):
+        """A missing name should be the only validation error"""
+        with pytest.raises(ValidationError) as exc_info:
+            Task()
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("name",)
+
     def test_forbid_extra_fields(self):
         """Task model_config should forbid extra fields"""
         with pytest.raises(ValueError):
@@ -76,26 +95,105 @@ class TestTaskConfigValidation:
 class TestTaskInheritance:
     """Test Task inherits Entity methods"""
 
-    def test_has_mark_updated_method(self):
+    def test_has_mark_updated_method(self, task):
         """Task should inherit mark_updated() from Entity"""
-        task = Task(name="Buy milk")
         assert hasattr(task, "mark_updated")
         assert callable(task.mark_updated)
 
-    def test_has_activate_method(self):
+    def test_has_activate_method(self, task):
         """Task should inherit activate() from Entity"""
-        task = Task(name="Buy milk")
         assert hasattr(task, "activate")
         assert callable(task.activate)
 
-    def test_has_deactivate_method(self):
+    def test_has_deactivate_method(self, task):
         """Task should inherit deactivate() from Entity"""
-        task = Task(name="Buy milk")
         assert hasattr(task, "deactivate")
         assert callable(task.deactivate)
 
-    def test_has_delete_method(self):
+    def test_has_delete_method(self, task):
         """Task should inherit delete() from Entity"""
-        task = Task(name="Buy milk")
         assert hasattr(task, "delete")
         assert callable(task.delete)
+
+
+class TestTaskBuildMany:
+    """Test bulk Task construction"""
+
+    def test_build_many_returns_tasks(self):
+        """build_many should validate every item into a Task"""
+        tasks = Task.build_many([{"name": "Task 1"}, {"name": "Task 2"}])
+        assert [task.name for task in tasks] == ["Task 1", "Task 2"]
+        assert all(isinstance(task, Task) for task in tasks)
+        assert tasks[0].code != tasks[1].code
+
+    def test_build_many_uses_calling_class(self):
+        """build_many on a subclass should build instances of that subclass"""
+
+        class SubTask(Task):
+            pass
+
+        tasks = SubTask.build_many([{"name": "Buy milk"}])
+        assert type(tasks[0]) is SubTask
+
+    def test_build_many_validates_items(self):
+        """build_many should reject invalid items"""
+        with pytest.raises(ValueError):
+            Task.build_many([{"name": "Buy milk"}, {"name": ""}])
+
+
+class TestTaskLifecycle:
+    """Test Entity lifecycle methods on a Task"""
+
+    def test_deactivate_updates_audit_trail(self, task):
+        """deactivate() should set state, bump version and record the user"""
+        previous = task.updated_at
+        task.deactivate("alice")
+        assert task.state == 0
+        assert task.version == 2
+        assert task.updated_by == "alice"
+        assert task.updated_at >= previous
+
+    def test_mutations_are_tracked_as_set_fields(self, task):
+        """Lifecycle mutations should show up in model_fields_set"""
+        task.delete("alice")
+        assert {"state", "updated_at", "updated_by", "version"} <= task.model_fields_set
+
+    def test_state_stays_plain_int(self, task):
+        """state should be a plain int by default and after transitions"""
+        assert type(task.state) is int
+        task.deactivate()
+        assert type(task.state) is int
+        assert task.is_inactive()
+        task.activate()
+        assert task.is_active()
+
+    def test_new_task_timestamps_match(self):
+        """created_at and updated_at should come from the same clock read"""
+        task = Task(name="Buy milk")
+        assert task.created_at == task.updated_at
+
+    def test_defaults_are_not_marked_as_set(self):
+        """Default timestamps should not show up in model_fields_set"""
+        task = Task(name="Buy milk")
+        assert task.model_fields_set == {"name"}
+
+    def test_explicit_updated_at_is_kept(self):
+        """A provided updated_at should not be overwritten at construction"""
+        stamp = datetime(2024, 1, 1, tzinfo=UTC)
+        task = Task(name="Buy milk", updated_at=stamp)
+        assert task.updated_at == stamp
+
+
+class TestTaskFromTrusted:
+    """Test Task hydration from trusted data"""
+
+    def test_from_trusted_round_trip(self, task):
+        """from_trusted should rebuild an equal task from its dump"""
+        assert Task.from_trusted(task.model_dump()) == task
+
+    def test_from_trusted_fills_defaults(self):
+        """from_trusted should apply defaults for missing fields"""
+        task = Task.from_trusted({"name": "Buy milk"})
+        assert task.code.startswith("TASK-")
+        assert task.status == "pending"
+        assert task.created_at == task.updated_at